@@ -11,22 +11,13 @@ for o,a in opts:
 		name = a
 
 with open(filename, "rb") as f:
-	hexdata = f.read().hex()
-	tokens = [hexdata[i:i+2] for i in range(0, len(hexdata), 2)]
+	data = f.read()
+	tokens = ["0x%02x" % b for b in data]
+	# 20 bytes per line
+	lines = [" ".join(tokens[i:i+20]) for i in range(0, len(tokens), 20)]
 	res = "(def " + name + " [\n"
-	cnt = 0
-	for c in tokens:
-		res += "0x" + c
-		cnt = cnt + 1
-		if cnt == 20:
-			cnt = 0
-			res += "\n"
-		else:
-			res += " "
-	
-	if res[-1] == '\n':
-		res += "])\n"
-	else:
-		res += "\n])\n"
+	if lines:
+		res += "\n".join(lines) + "\n"
+	res += "])\n"
 	print(res)
 
@@ -1,5 +1,7 @@
 from glob import glob
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg') # Only writing PNGs, no GUI backend needed
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -13,18 +15,20 @@ benches = ['q2.lisp', 'fibonacci_tail.lisp', 'dec_cnt3.lisp',
 
 data = []
 
+# Parse every stored result once, keyed by the date in its filename
+results = {}
+for file in bench_files:
+    file_info = file.split('benchresult')[1]
+    file_details = file_info.split('_')
+    date = file_details[0] + '-' + file_details[1] + '-' + file_details[2] + '-' + file_details[3] + '-' + file_details[4]
+    results[date] = pd.read_csv(file,index_col='File')
+
 plt.figure(figsize=(10.0, 5.0)) # in inches!
 cmap = plt.get_cmap('jet')
 colors = cmap(np.linspace(0, 1.0, len(benches)))
 for bench, color in zip(benches,colors):
     dict = {}
-    for file in bench_files:
-        file_info = file.split('benchresult')[1]
-        file_details = file_info.split('_')
-        df = pd.read_csv(file,index_col='File')
-        
-        date = file_details[0] + '-' + file_details[1] + '-' + file_details[2] + '-' + file_details[3] + '-' + file_details[4]
-
+    for date, df in results.items():
         if (bench in df.index):
             row = df.loc[bench]
             # Use iloc[1] for second column (Eval time) - works with all file formats
@@ -48,6 +52,6 @@ ax.tick_params(axis='both', which='minor', labelsize=4)
 ax.set_facecolor("lightgray");
 plt.ylabel("Eval Time (Sec)")
 plt.grid()
-plt.savefig('benchresults.png', dpi=600, bbox_extra_artists=(lgd,), bbox_inches='tight')     
+plt.savefig('benchresults.png', dpi=300, bbox_extra_artists=(lgd,), bbox_inches='tight')     
 plt.yscale('log')
-plt.savefig('benchresults_log.png', dpi=600, bbox_extra_artists=(lgd,), bbox_inches='tight')     
+plt.savefig('benchresults_log.png', dpi=300, bbox_extra_artists=(lgd,), bbox_inches='tight')     